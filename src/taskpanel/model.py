@@ -17,6 +17,7 @@ import signal
 import subprocess
 import threading
 import time
+from collections import deque
 from enum import Enum
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -66,6 +67,9 @@ class Step:
         self.logger.setLevel(logging.DEBUG)
 
         self.log_handler = logging.handlers.MemoryHandler(capacity=DEBUG_LOG_MAX_LINES)
+        # MemoryHandler only empties its buffer when flushing to a target, and
+        # there is none, so bound it here to keep the newest records only.
+        self.log_handler.buffer = deque(maxlen=DEBUG_LOG_MAX_LINES)
         formatter = logging.Formatter("[%(asctime)s] %(message)s", datefmt="%H:%M:%S")
         self.log_handler.setFormatter(formatter)
 
@@ -108,6 +112,14 @@ class TaskModel:
         self.log_dir = self.workflow_path.parent / f".{base_name}{LOG_DIR_SUFFIX}"
         self.tasks: List[Task] = []
         self.dynamic_header: List[str] = []
+        # Column widths maintained as tasks/headers are added, so the view
+        # never has to rescan every task to lay out the table.
+        self.max_name_len = 0
+        self.max_step_header_len = 0
+        # Bumped under state_lock whenever a step's status or start_time
+        # changes, so the UI can tell whether anything needs redrawing
+        # without rescanning all steps.
+        self.version = 0
         self.state_lock = threading.RLock()
 
     def _generate_task_uid(self, name: str, info: str) -> str:
@@ -123,6 +135,15 @@ class TaskModel:
         h.update("|".join(commands).encode("utf-8"))
         return h.hexdigest()
 
+    def _set_dynamic_header(self, header: List[str]):
+        self.dynamic_header = header
+        self.max_name_len = max(self.max_name_len, len(header[0]))
+        self.max_step_header_len = max([len(h) for h in header[2:]] + [0])
+
+    def _append_task(self, task: Task):
+        self.tasks.append(task)
+        self.max_name_len = max(self.max_name_len, len(task.name))
+
     def _log_step_debug(self, task_index: int, step_index: int, message: str):
         if 0 <= task_index < len(self.tasks) and 0 <= step_index < len(
             self.tasks[task_index].steps
@@ -223,7 +244,7 @@ class TaskModel:
                 step_headers = derived
 
             # Header setup
-            self.dynamic_header = ["TaskName", "Description"] + list(step_headers)
+            self._set_dynamic_header(["TaskName", "Description"] + list(step_headers))
 
             # Build tasks
             allowed_task_keys = {"name", "info", "description", "steps"}
@@ -285,7 +306,7 @@ class TaskModel:
                     )
                     for i, cmd in enumerate(commands)
                 ]
-                self.tasks.append(Task(idx, uid, name, info, steps, structure_hash))
+                self._append_task(Task(idx, uid, name, info, steps, structure_hash))
 
             print(f"Loaded {len(self.tasks)} tasks successfully.")
             self._resume_state()
@@ -307,7 +328,7 @@ class TaskModel:
                 ]
                 if not all_rows:
                     return
-                self.dynamic_header = [h.strip() for h in all_rows.pop(0)]
+                self._set_dynamic_header([h.strip() for h in all_rows.pop(0)])
                 if len(self.dynamic_header) < 2:
                     raise TaskLoadError(
                         "FATAL: CSV header must have at least 'TaskName' and 'Info' columns."
@@ -345,7 +366,7 @@ class TaskModel:
                         )
                         for i, cmd in enumerate(commands)
                     ]
-                    self.tasks.append(
+                    self._append_task(
                         Task(line_num, uid, name, info, steps, structure_hash)
                     )
             print(f"Loaded {len(self.tasks)} tasks successfully.")
@@ -409,6 +430,7 @@ class TaskModel:
                 for uid, task in task_map.items():
                     if uid in saved_states:
                         self._apply_saved_state_to_task(task, saved_states[uid])
+                self.version += 1
         except (json.JSONDecodeError, IOError, KeyError) as e:
             print(
                 f"Warning: Could not parse state file '{self.state_file_path}'. Starting fresh. Error: {e}"
@@ -480,6 +502,7 @@ class TaskModel:
                 return
             step.status = Status.FAILED
             step.start_time = None
+            self.version += 1
             self._log_step_debug(task_index, step_index, error_message)
             try:
                 with open(step.log_path_stderr, "ab") as f:
@@ -514,6 +537,7 @@ class TaskModel:
                     continue
                 step.status = Status.RUNNING
                 step.start_time = time.time()
+                self.version += 1
                 self._log_step_debug(
                     task_index, i, f"Starting step (run_counter {run_counter})."
                 )
@@ -553,6 +577,9 @@ class TaskModel:
                         step.status = (
                             Status.SUCCESS if process.returncode == 0 else Status.FAILED
                         )
+                    # Also covers the SKIPPED marks below: readers hold
+                    # state_lock, so they see the whole transition at once.
+                    self.version += 1
                     self._log_step_debug(
                         task_index,
                         i,
@@ -627,6 +654,7 @@ class TaskModel:
                         self._log_step_debug(
                             task_index, i, f"Error removing log files: {e}"
                         )
+            self.version += 1
         executor.submit(
             self.run_task_row, task_index, new_run_counter, start_step_index
         )
@@ -653,6 +681,8 @@ class TaskModel:
                         kill_point_found = True
                     elif step.status == Status.PENDING and kill_point_found:
                         step.status = Status.SKIPPED
+            if kill_point_found:
+                self.version += 1
 
     def cleanup(self):
         with self.state_lock:
@@ -20,7 +20,10 @@ from .view import ViewState, draw_ui, setup_colors
 # Constants for timing and key codes
 MAIN_LOOP_SLEEP_S = 0.05
 UI_REFRESH_INTERVAL_S = 0.5
+IDLE_REFRESH_INTERVAL_S = 2.0
+MIN_REDRAW_INTERVAL_S = 1 / 60
 SHUTDOWN_CLEANUP_WAIT_S = 1
+MAX_KEYS_PER_TICK = 32
 ENTER_KEYS = (curses.KEY_ENTER, 10, 13)
 BACKSPACE_KEYS = (curses.KEY_BACKSPACE, 127)
 
@@ -302,13 +305,14 @@ class AppController:
             ]
             self.model.kill_task_row(original_task_index)
 
-    def process_input(self):
+    def process_input(self) -> bool:
+        """Handle one pending key. Returns False when no key was waiting."""
         try:
             key = self.stdscr.getch()
         except curses.error:
             key = -1
         if key == -1:
-            return
+            return False
         self.ui_dirty = True
         if self.is_search_mode:
             if key in ENTER_KEYS:
@@ -329,26 +333,54 @@ class AppController:
                 self.key_handlers[key]()
         elif key in self.key_handlers:
             self.key_handlers[key]()
+        return True
+
+    def drain_input(self) -> bool:
+        """
+        Handle every key queued since the last frame (e.g. auto-repeated
+        arrows or PgDn) so a burst of input costs a single redraw.
+        Returns True if any key was handled.
+        """
+        handled = False
+        for _ in range(MAX_KEYS_PER_TICK):
+            if not self.app_running or not self.process_input():
+                break
+            handled = True
+        return handled
 
     def run_loop(self):
         try:
             self.start_initial_tasks()
-            last_state_snapshot = None
-            last_refresh_time = time.time()
+            last_version = None
+            any_running = False
+            last_refresh_time = float("-inf")  # no frame drawn yet
             while self.app_running:
                 self.view_state.spinner_frame += 1
                 with self.model.state_lock:
-                    current_state_snapshot = [
-                        (s.status.value, s.start_time) if s else None
-                        for t in self.model.tasks
-                        for s in t.steps
-                    ]
-                if current_state_snapshot != last_state_snapshot:
-                    self.ui_dirty = True
-                    last_state_snapshot = current_state_snapshot
-                if time.time() - last_refresh_time > UI_REFRESH_INTERVAL_S:
+                    if self.model.version != last_version:
+                        last_version = self.model.version
+                        any_running = any(
+                            s and s.status == Status.RUNNING
+                            for t in self.model.tasks
+                            for s in t.steps
+                        )
+                        self.ui_dirty = True
+                # Frame pacing uses the monotonic clock so that wall-clock
+                # adjustments (NTP, manual changes) cannot stall redraws.
+                since_refresh = time.monotonic() - last_refresh_time
+                # Spinners and timers of running steps need frequent redraws.
+                # Idle frames are still needed, only less often: background
+                # children of a finished step's shell can keep writing its
+                # logs, and some debug records change no status. Unchanged
+                # panes and rows are skipped by draw_ui, so these are cheap.
+                refresh_interval = (
+                    UI_REFRESH_INTERVAL_S if any_running else IDLE_REFRESH_INTERVAL_S
+                )
+                if since_refresh > refresh_interval:
                     self.ui_dirty = True
-                if self.ui_dirty:
+                # Coalesce bursts of changes (key repeat, many steps finishing
+                # together) into at most one frame per MIN_REDRAW_INTERVAL_S.
+                if self.ui_dirty and since_refresh >= MIN_REDRAW_INTERVAL_S:
                     draw_ui(
                         self.stdscr,
                         self.model,
@@ -359,9 +391,18 @@ class AppController:
                         self.title,
                     )
                     self.ui_dirty = False
-                    last_refresh_time = time.time()
-                self.process_input()
-                time.sleep(MAIN_LOOP_SLEEP_S)
+                    last_refresh_time = time.monotonic()
+                # Redraw soon after input; otherwise idle until the next tick.
+                if not self.drain_input():
+                    time.sleep(MAIN_LOOP_SLEEP_S)
+                else:
+                    time.sleep(
+                        max(
+                            0.0,
+                            MIN_REDRAW_INTERVAL_S
+                            - (time.monotonic() - last_refresh_time),
+                        )
+                    )
         except KeyboardInterrupt:
             self.app_running = False
             print("\nInterrupted by user (Ctrl+C).")
@@ -8,16 +8,46 @@ This module handles all rendering logic using 'curses'.
 OPTIMIZED to use model-defined log formatters, respecting MVC separation.
 """
 import curses
+import logging
 import os
 import time
+from collections import OrderedDict, deque
 from enum import Enum, auto
+from functools import lru_cache
+from itertools import islice
 from textwrap import wrap
-from typing import List, NamedTuple, Optional, Tuple
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
 from .model import Status, Step, Task, TaskModel
 
 
 # --- Data Structures & Constants ---
+class PanelWindow:
+    """
+    A persistent curses window for one bottom pane. It is recreated only when
+    its geometry changes, and `render_key` records what it currently shows so
+    the pane can skip redrawing unchanged content.
+    """
+
+    def __init__(self):
+        self.win = None
+        self.geometry = None
+        self.render_key = None
+
+    def get(self, nlines: int, ncols: int, y: int, x: int):
+        geometry = (nlines, ncols, y, x)
+        if self.win is None or self.geometry != geometry:
+            self.win = curses.newwin(nlines, ncols, y, x)
+            # Leave the hardware cursor to stdscr (e.g. the search bar prompt).
+            self.win.leaveok(True)
+            self.geometry = geometry
+            self.render_key = None
+        return self.win
+
+    def close(self):
+        self.win = self.geometry = self.render_key = None
+
+
 class ViewState:
     def __init__(self):
         self.top_row = 0
@@ -29,8 +59,17 @@ class ViewState:
         self.debug_scroll_offset = 0
         self.spinner_frame = 0
         self.log_cache = {}
+        self.info_cache = {}
+        self.debug_wrap_cache = {}
         self.layout_dirty = True
         self.cached_layout: Optional[LayoutDimensions] = None
+        self.layout_key = None
+        self.log_pane = PanelWindow()
+        self.debug_pane = PanelWindow()
+        # stdscr is only erased when screen_key changes; in between, task rows
+        # are rewritten only when their text or colouring (row_keys) differs.
+        self.screen_key = None
+        self.row_keys: Dict[int, Tuple[str, list]] = {}
 
 
 class LayoutDimensions(NamedTuple):
@@ -44,8 +83,24 @@ class LayoutDimensions(NamedTuple):
     debug_panel_w: int
 
 
+class TaskRowSnapshot(NamedTuple):
+    task: Task
+    # (status, start_time) for each visible step column, None for empty steps.
+    step_states: List[Optional[Tuple[Status, Optional[float]]]]
+
+
+class FrameSnapshot(NamedTuple):
+    dynamic_header: List[str]
+    rows: List[TaskRowSnapshot]
+    selected_task: Optional[Task]
+    selected_step: Optional[Step]
+    debug_records: List[logging.LogRecord]
+
+
 LOG_BUFFER_LINES = 200
 TAIL_BUFFER_SIZE = 4096
+TAIL_CACHE_SIZE = 64
+TAIL_SEAM_BYTES = 64
 MIN_APP_HEIGHT = 15
 MAX_TASK_LIST_HEIGHT = 20
 MIN_BOTTOM_PANE_H = 8
@@ -56,11 +111,15 @@ MIN_STEP_COLUMN_WIDTH = 15
 TABLE_X_OFFSET = 1
 COL_PADDING = 2
 INTER_COL_SEPARATOR_WIDTH = 1
+NAME_INFO_GAP = " " * COL_PADDING
+INFO_STEPS_GAP = " " * INTER_COL_SEPARATOR_WIDTH
 EMPTY_STEP_TEXT = " --- "
 SCROLL_UP_INDICATOR = "[^ ... more]"
 SCROLL_DOWN_INDICATOR = "[v ... more]"
 SCROLL_INDICATOR_PADDING = 15
 SPINNER_CHARS = "|/-\\"
+# Leading header columns (task name, info) before the first step column.
+STEP_HEADER_OFFSET = 2
 
 
 class ColorPair(Enum):
@@ -88,6 +147,11 @@ STATUS_COLOR_MAP = {
     Status.KILLED: ColorPair.KILLED,
 }
 
+# Curses attributes per colour pair and per step status (None: empty step).
+# Plain (0) until setup_colors() resolves the real pairs.
+PAIR_ATTRS: Dict[ColorPair, int] = dict.fromkeys(ColorPair, 0)
+STATUS_ATTRS: Dict[Optional[Status], int] = dict.fromkeys([*Status, None], 0)
+
 
 def format_duration(seconds: Optional[float]) -> str:
     if seconds is None:
@@ -143,60 +207,172 @@ def setup_colors():
     curses.init_pair(ColorPair.STDERR.value, curses.COLOR_RED, default_bg)
     # Use default color for empty steps, but dimmed.
     curses.init_pair(ColorPair.EMPTY_STEP.value, default_fg, default_bg)
+    _init_attr_tables()
+
+
+def _init_attr_tables():
+    """Resolve colour pair and per-status attributes once the pairs exist."""
+    PAIR_ATTRS.clear()
+    for pair in ColorPair:
+        PAIR_ATTRS[pair] = curses.color_pair(pair.value)
+    STATUS_ATTRS.clear()
+    for status in Status:
+        STATUS_ATTRS[status] = get_status_color(status)
+    STATUS_ATTRS[None] = PAIR_ATTRS[ColorPair.EMPTY_STEP] | curses.A_DIM
+
+
+@lru_cache(maxsize=4)
+def _status_cells(width: int) -> Dict[Optional[Status], str]:
+    """Centered step-cell labels for every status (None: empty step)."""
+    cells: Dict[Optional[Status], str] = {
+        status: f" {status.value} ".center(width) for status in Status
+    }
+    cells[None] = EMPTY_STEP_TEXT.center(width)
+    return cells
 
 
 def get_status_color(status: Status):
     return curses.color_pair(STATUS_COLOR_MAP.get(status, ColorPair.DEFAULT).value)
 
 
+def _read_tail(fd: int, file_size: int, num_lines: int) -> bytes:
+    """
+    Bytes of file `fd` from roughly `num_lines` lines before `file_size`,
+    reading backwards one block at a time and reading each block only once.
+    """
+    blocks = []
+    lines_found = 0
+    end = file_size
+    while lines_found < num_lines and end > 0:
+        start = max(0, end - TAIL_BUFFER_SIZE)
+        block = os.pread(fd, end - start, start)
+        blocks.append(block)
+        lines_found += block.count(b"\n")
+        end = start
+    return b"".join(reversed(blocks))
+
+
+def _decode_lines(data: bytes, num_lines: int) -> List[str]:
+    """The last `num_lines` lines of `data`, decoding only the ones kept."""
+    return [
+        line.decode("utf-8", errors="replace") + "\n"
+        for line in data.splitlines()[-num_lines:]
+    ]
+
+
 def _tail_file(filename: str, num_lines: int) -> List[str]:
-    if not os.path.exists(filename):
-        return []
     try:
-        with open(filename, "rb") as f:
-            f.seek(0, os.SEEK_END)
-            file_size = f.tell()
+        fd = os.open(filename, os.O_RDONLY)
+        try:
+            file_size = os.fstat(fd).st_size
             if file_size == 0:
                 return []
-            buffer_size = TAIL_BUFFER_SIZE
-            lines_found = 0
-            block_num = 0
-            while lines_found < num_lines and file_size > 0:
-                block_num += 1
-                seek_pos = file_size - (block_num * buffer_size)
-                if seek_pos < 0:
-                    seek_pos = 0
-                f.seek(seek_pos, os.SEEK_SET)
-                buffer = f.read(buffer_size)
-                lines_found += buffer.count(b"\n")
-                if seek_pos == 0:
-                    break
-            f.seek(
-                file_size - (block_num * buffer_size)
-                if file_size > (block_num * buffer_size)
-                else 0
-            )
-            return [
-                line.decode("utf-8", errors="replace") + "\n"
-                for line in f.read().splitlines()[-num_lines:]
-            ]
+            return _decode_lines(_read_tail(fd, file_size, num_lines), num_lines)
+        finally:
+            os.close(fd)
+    except FileNotFoundError:
+        return []
     except (IOError, OSError) as e:
         return [f"[Error tailing log '{filename}': {e}]\n"]
 
 
+class _TailEntry(NamedTuple):
+    num_lines: int
+    ino: int
+    mtime_ns: int
+    size: int
+    lines: List[str]  # what _tail_file() returns for this size
+    complete: List[str]  # decoded lines up to the last newline
+    partial: bytes  # bytes after the last newline
+    seam: bytes  # last TAIL_SEAM_BYTES bytes before `size`
+
+
+# filename -> _TailEntry, least recently used first.
+_TAIL_CACHE: "OrderedDict[str, _TailEntry]" = OrderedDict()
+
+
+def _tail_file_cached(filename: str, num_lines: int) -> List[str]:
+    """
+    _tail_file() memoized on the file's mtime and size, so logs that have not
+    changed since the last frame (finished or idle steps) cost one stat().
+    When a log has only grown, just the appended bytes are read and decoded.
+    """
+    try:
+        st = os.stat(filename)
+    except OSError:
+        return _tail_file(filename, num_lines)
+    entry = _TAIL_CACHE.get(filename)
+    grown = False
+    if entry is not None and entry.num_lines == num_lines:
+        if (
+            entry.ino == st.st_ino
+            and entry.mtime_ns == st.st_mtime_ns
+            and entry.size == st.st_size
+        ):
+            _TAIL_CACHE.move_to_end(filename)
+            return entry.lines
+        grown = entry.ino == st.st_ino and st.st_size > entry.size
+    try:
+        fd = os.open(filename, os.O_RDONLY)
+        try:
+            data = None
+            if grown:
+                # A rerun truncates the log in place ("wb") and may write past
+                # the old size before the next frame; only trust the cached
+                # lines if the bytes just before the old end are unchanged.
+                start = entry.size - len(entry.seam)
+                chunk = os.pread(fd, st.st_size - start, start)
+                if chunk.startswith(entry.seam):
+                    data = entry.partial + chunk[len(entry.seam) :]
+                    complete = entry.complete
+                    seam = chunk[-TAIL_SEAM_BYTES:]
+            if data is None:
+                data = _read_tail(fd, st.st_size, num_lines)
+                complete = []
+                seam = data[-TAIL_SEAM_BYTES:]
+        finally:
+            os.close(fd)
+    except (IOError, OSError) as e:
+        return [f"[Error tailing log '{filename}': {e}]\n"]
+    cut = data.rfind(b"\n") + 1
+    complete = (complete + _decode_lines(data[:cut], num_lines))[-num_lines:]
+    partial = data[cut:]
+    lines = (
+        (complete + _decode_lines(partial, num_lines))[-num_lines:]
+        if partial
+        else complete
+    )
+    _TAIL_CACHE[filename] = _TailEntry(
+        num_lines,
+        st.st_ino,
+        st.st_mtime_ns,
+        st.st_size,
+        lines,
+        complete,
+        partial,
+        seam,
+    )
+    _TAIL_CACHE.move_to_end(filename)
+    if len(_TAIL_CACHE) > TAIL_CACHE_SIZE:
+        _TAIL_CACHE.popitem(last=False)
+    return lines
+
+
 def read_log_files(step: Optional[Step]) -> List[Tuple[str, ColorPair]]:
     if not step:
         return []
-    all_lines: List[Tuple[str, ColorPair]] = []
-    stdout = _tail_file(step.log_path_stdout, LOG_BUFFER_LINES)
-    stderr = _tail_file(step.log_path_stderr, LOG_BUFFER_LINES)
+    # Bounded buffer: once stderr is appended, the oldest stdout lines simply
+    # fall off the front instead of being sliced away afterwards.
+    all_lines: "deque[Tuple[str, ColorPair]]" = deque(maxlen=LOG_BUFFER_LINES)
+    stdout = _tail_file_cached(step.log_path_stdout, LOG_BUFFER_LINES)
+    stderr = _tail_file_cached(step.log_path_stderr, LOG_BUFFER_LINES)
     if stdout:
         all_lines.append(("[STDOUT]\n", ColorPair.OUTPUT_HEADER))
-        all_lines.extend([(line, ColorPair.DEFAULT) for line in stdout])
+        all_lines.extend((line, ColorPair.DEFAULT) for line in stdout)
     if stderr:
         all_lines.append(("\n[STDERR]\n", ColorPair.STDERR))
-        all_lines.extend([(line, ColorPair.STDERR) for line in stderr])
-    return all_lines[-LOG_BUFFER_LINES:]
+        all_lines.extend((line, ColorPair.STDERR) for line in stderr)
+    return list(all_lines)
 
 
 def calculate_layout_dimensions(
@@ -220,14 +396,8 @@ def calculate_layout_dimensions(
             log_panel_w,
             debug_panel_w,
         )
-    max_name = max([len(t.name) for t in model.tasks] + [len(model.dynamic_header[0])])
-    step_headers = model.dynamic_header[2:]
-    step_w = (
-        max([len(h) for h in step_headers] + [MIN_STEP_COLUMN_WIDTH])
-        if step_headers
-        else MIN_STEP_COLUMN_WIDTH
-    )
-    step_w += COL_PADDING
+    max_name = model.max_name_len
+    step_w = max(model.max_step_header_len, MIN_STEP_COLUMN_WIDTH) + COL_PADDING
     steps_start_x = (
         TABLE_X_OFFSET
         + max_name
@@ -252,126 +422,266 @@ def _safe_addstr(stdscr, y, x, text, attr=0):
     try:
         h, w = stdscr.getmaxyx()
         if y < h and 0 <= x < w:
-            stdscr.addstr(y, x, text[: w - x], attr)
+            # addnstr clips in C; no sliced copy of the text per write.
+            stdscr.addnstr(y, x, text, w - x, attr)
     except curses.error:
         pass
 
 
-def _draw_header(stdscr, w: int, title: str, is_search_mode: bool):
+def _safe_chgat(stdscr, y, x, n, attr):
+    try:
+        h, w = stdscr.getmaxyx()
+        if y < h and 0 <= x < w:
+            stdscr.chgat(y, x, min(n, w - x), attr)
+    except curses.error:
+        pass
+
+
+@lru_cache(maxsize=8)
+def _header_lines(w: int, title: str, is_search_mode: bool) -> Tuple[str, str]:
+    """Title and help lines padded/clipped to the terminal width."""
     help_text = (
         "SEARCH MODE: Type to filter. ESC to clear/exit. ENTER to confirm."
         if is_search_mode
         else "ARROWS:Nav | /:Search | r:Rerun | k:Kill | [/]:Log | {}:Dbg | d:Debug | q:Quit"
     )
-    header_attr = curses.color_pair(ColorPair.HEADER.value)
-    _safe_addstr(stdscr, 0, 0, title.ljust(w), header_attr)
-    _safe_addstr(stdscr, 1, 0, help_text.ljust(w), header_attr)
+    return f"{title:<{w}.{w}}", f"{help_text:<{w}.{w}}"
+
+
+def _step_header(dynamic_header: List[str], col: int) -> str:
+    """Header text of step column `col`, or "" if the workflow has none."""
+    idx = col + STEP_HEADER_OFFSET
+    return dynamic_header[idx] if idx < len(dynamic_header) else ""
+
+
+def _draw_header(stdscr, w: int, title: str, is_search_mode: bool):
+    title_line, help_line = _header_lines(w, title, is_search_mode)
+    header_attr = PAIR_ATTRS[ColorPair.HEADER]
+    _safe_addstr(stdscr, 0, 0, title_line, header_attr)
+    _safe_addstr(stdscr, 1, 0, help_line, header_attr)
+
+
+@lru_cache(maxsize=256)
+def _is_narrow(text: str) -> bool:
+    """
+    True when `text` is plain ASCII, so every character takes one screen
+    column and string offsets can stand in for x positions. Wide (e.g. CJK)
+    characters take two columns and would shift everything after them.
+    """
+    return len(text.encode("utf-8")) == len(text)
+
+
+@lru_cache(maxsize=256)
+def _row_prefix(name: str, info: str, name_w: int, info_w: int) -> str:
+    """
+    The padded name and info columns of a task row, up to the first step
+    column. Memoized, so scrolling and redraws reuse the strings.
+    """
+    lines = info.splitlines()
+    info_line = (lines[0] if lines else "").strip()
+    if len(info_line) > info_w - 3:
+        info_line = info_line[: info_w - 3]
+    if len(lines) > 1 or len(info_line) > info_w - 3:
+        info_line = info_line + "..."
+    # Format specs pad (and clip) in one step instead of ljust() copies.
+    return (
+        f"{name:<{name_w}.{name_w}}{NAME_INFO_GAP}"
+        f"{info_line:<{info_w}.{info_w}}{INFO_STEPS_GAP}"
+    )
+
+
+@lru_cache(maxsize=8)
+def _table_header_line(
+    header: Tuple[str, ...],
+    left_most_step: int,
+    num_steps: int,
+    name_w: int,
+    info_w: int,
+    step_w: int,
+) -> str:
+    """
+    The table header row as one string: name, info and the visible step
+    headers, each centered in its column.
+    """
+    name_span = name_w + COL_PADDING
+    info_span = info_w + INTER_COL_SEPARATOR_WIDTH
+    first = left_most_step + STEP_HEADER_OFFSET
+    name_cell = header[0].center(name_w)[:name_span]
+    info_cell = header[1].center(info_w)[:info_span]
+    return f"{name_cell:<{name_span}}{info_cell:<{info_span}}" + "".join(
+        text.center(step_w) for text in header[first : first + num_steps]
+    )
 
 
 def _draw_task_row(
     stdscr,
     y: int,
-    task: Task,
+    row: TaskRowSnapshot,
     is_selected: bool,
     vs: ViewState,
     layout: LayoutDimensions,
+    step_xs: List[int],
 ):
-    _safe_addstr(
-        stdscr,
-        y,
-        TABLE_X_OFFSET,
-        task.name.ljust(layout.max_name_len),
-        curses.A_REVERSE if is_selected else 0,
-    )
-    info_x = TABLE_X_OFFSET + layout.max_name_len + COL_PADDING
-    lines = task.info.splitlines()
-    info_line = (lines[0] if lines else "").strip()
-    if len(info_line) > layout.info_col_width - 3:
-        info_line = info_line[: layout.info_col_width - 3]
-    if len(lines) > 1 or len(info_line) > layout.info_col_width - 3:
-        info_line = info_line + "..."
+    """
+    Draw one task row with a single addstr() of the pre-assembled line, then
+    colour its regions in place with chgat(). `step_xs` holds the screen x of
+    each visible step column, precomputed once per frame by the table.
+    Rows whose name or info is not plain ASCII are written column by column
+    at fixed x instead, as their string offsets do not match screen columns.
+    """
+    task = row.task
+    name_w, info_w = layout.max_name_len, layout.info_col_width
+    info_x = TABLE_X_OFFSET + name_w + COL_PADDING
+    name_attr = curses.A_REVERSE if is_selected else 0
     info_attr = (
-        curses.color_pair(ColorPair.SELECTED.value)
-        if is_selected and vs.selected_col == -1
-        else 0
+        PAIR_ATTRS[ColorPair.SELECTED] if is_selected and vs.selected_col == -1 else 0
     )
-    _safe_addstr(stdscr, y, info_x, info_line.ljust(layout.info_col_width), info_attr)
-    for i in range(layout.num_visible_steps):
-        step_idx = vs.left_most_step + i
-        if step_idx >= len(task.steps):
-            break
-        step = task.steps[step_idx]
-        start_x = (
-            info_x
-            + layout.info_col_width
-            + INTER_COL_SEPARATOR_WIDTH
-            + (i * layout.step_col_width)
-        )
-        is_sel_col = is_selected and step_idx == vs.selected_col
-        attr, text = (0, "")
-        if step:
-            attr = get_status_color(step.status)
-            text = f" {step.status.value} "
-            if step.status == Status.RUNNING:
-                spinner_char = SPINNER_CHARS[vs.spinner_frame % len(SPINNER_CHARS)]
-                timer_str = format_duration(
-                    time.time() - step.start_time if step.start_time else None
-                )
-                text = f" {spinner_char} {timer_str} "
+    # (x, width, attr) regions to colour after the row is written
+    spans = [(TABLE_X_OFFSET, name_w, name_attr), (info_x, info_w, info_attr)]
+    # Selected column relative to the horizontal scroll; -1 matches no cell.
+    sel_col = vs.selected_col - vs.left_most_step if is_selected else -1
+    step_w = layout.step_col_width
+    status_cells = _status_cells(step_w)
+    spinner_char = SPINNER_CHARS[vs.spinner_frame % len(SPINNER_CHARS)]
+    now = time.time()
+    cells = []
+    for i, (x, step_state) in enumerate(zip(step_xs, row.step_states)):
+        status = step_state[0] if step_state else None
+        attr = STATUS_ATTRS[status]
+        if status is Status.RUNNING:
+            start_time = step_state[1]
+            timer_str = format_duration(now - start_time if start_time else None)
+            cell = f" {spinner_char} {timer_str} ".center(step_w)
         else:
-            attr = curses.color_pair(ColorPair.EMPTY_STEP.value) | curses.A_DIM
-            text = EMPTY_STEP_TEXT
-        if is_sel_col:
-            attr = curses.color_pair(ColorPair.SELECTED.value)
-        _safe_addstr(stdscr, y, start_x, text.center(layout.step_col_width), attr)
+            cell = status_cells[status]
+        if i == sel_col:
+            attr = PAIR_ATTRS[ColorPair.SELECTED]
+        cells.append(cell)
+        spans.append((x, step_w, attr))
+    prefix = _row_prefix(task.name, task.info, name_w, info_w)
+    row_text = prefix + "".join(cells)
+    row_key = (row_text, spans)
+    if vs.row_keys.get(y) == row_key:
+        return
+    vs.row_keys[y] = row_key
+    stdscr.move(y, 0)
+    stdscr.clrtoeol()
+    if _is_narrow(prefix):
+        _safe_addstr(stdscr, y, TABLE_X_OFFSET, row_text)
+        for x, width, attr in spans:
+            if attr:
+                _safe_chgat(stdscr, y, x, width, attr)
+        return
+    name_cell = prefix[:name_w]
+    info_cell = prefix[name_w + COL_PADDING : name_w + COL_PADDING + info_w]
+    for (x, _, attr), text in zip(spans, [name_cell, info_cell] + cells):
+        _safe_addstr(stdscr, y, x, text, attr)
 
 
 def _draw_task_table(
     stdscr,
-    model: TaskModel,
+    snapshot: FrameSnapshot,
     vs: ViewState,
-    filtered_indices: List[int],
     layout: LayoutDimensions,
 ):
+    dynamic_header = snapshot.dynamic_header
     header_y = HEADER_ROWS - 1
-    table_header_attr = curses.color_pair(ColorPair.TABLE_HEADER.value)
-    _safe_addstr(
-        stdscr,
-        header_y,
-        TABLE_X_OFFSET,
-        model.dynamic_header[0].center(layout.max_name_len),
-        table_header_attr,
+    name_w, info_w = layout.max_name_len, layout.info_col_width
+    info_x = TABLE_X_OFFSET + name_w + COL_PADDING
+    steps_x = info_x + info_w + INTER_COL_SEPARATOR_WIDTH
+    step_w = layout.step_col_width
+    # Only columns that start on screen; rows and the header then loop over
+    # exactly these instead of having each clipped write rejected.
+    w = stdscr.getmaxyx()[1]
+    step_xs = list(
+        range(steps_x, min(w, steps_x + layout.num_visible_steps * step_w), step_w)
     )
-    info_x = TABLE_X_OFFSET + layout.max_name_len + COL_PADDING
-    _safe_addstr(
-        stdscr,
-        header_y,
-        info_x,
-        model.dynamic_header[1].center(layout.info_col_width),
-        table_header_attr,
+    header_attr = PAIR_ATTRS[ColorPair.TABLE_HEADER]
+    header_text = _table_header_line(
+        tuple(dynamic_header),
+        vs.left_most_step,
+        len(step_xs),
+        name_w,
+        info_w,
+        step_w,
     )
-    for i in range(layout.num_visible_steps):
-        header_idx = vs.left_most_step + i + 2
-        if header_idx >= len(model.dynamic_header):
-            break
-        start_x = (
-            info_x
-            + layout.info_col_width
-            + INTER_COL_SEPARATOR_WIDTH
-            + (i * layout.step_col_width)
-        )
+    if _is_narrow(header_text):
+        # One write for the whole header row; the gaps between the name, info
+        # and step columns are then reset to the plain attribute.
+        _safe_addstr(stdscr, header_y, TABLE_X_OFFSET, header_text, header_attr)
+        _safe_chgat(stdscr, header_y, TABLE_X_OFFSET + name_w, COL_PADDING, 0)
+        _safe_chgat(stdscr, header_y, info_x + info_w, INTER_COL_SEPARATOR_WIDTH, 0)
+    else:
+        # Wide characters: centre each header in its own column at a fixed x.
+        first = vs.left_most_step + STEP_HEADER_OFFSET
+        stdscr.move(header_y, 0)
+        stdscr.clrtoeol()
         _safe_addstr(
             stdscr,
             header_y,
-            start_x,
-            model.dynamic_header[header_idx].center(layout.step_col_width),
-            table_header_attr,
+            TABLE_X_OFFSET,
+            dynamic_header[0].center(name_w),
+            header_attr,
         )
-    visible_indices = filtered_indices[vs.top_row : vs.top_row + layout.task_list_h]
-    for i, original_index in enumerate(visible_indices):
-        task = model.tasks[original_index]
+        _safe_addstr(
+            stdscr, header_y, info_x, dynamic_header[1].center(info_w), header_attr
+        )
+        for x, text in zip(step_xs, dynamic_header[first:]):
+            _safe_addstr(stdscr, header_y, x, text.center(step_w), header_attr)
+    for i, row in enumerate(snapshot.rows):
         is_selected = i + vs.top_row == vs.selected_row
-        _draw_task_row(stdscr, HEADER_ROWS + i, task, is_selected, vs, layout)
+        _draw_task_row(stdscr, HEADER_ROWS + i, row, is_selected, vs, layout, step_xs)
+    # Blank rows left over from a longer list, e.g. after the filter narrowed.
+    first_unused_y = HEADER_ROWS + len(snapshot.rows)
+    for y in [y for y in vs.row_keys if y >= first_unused_y]:
+        del vs.row_keys[y]
+        stdscr.move(y, 0)
+        stdscr.clrtoeol()
+
+
+def _snapshot_frame(
+    model: TaskModel,
+    vs: ViewState,
+    filtered_indices: List[int],
+    layout: LayoutDimensions,
+) -> FrameSnapshot:
+    """
+    Copy the mutable model state needed for one frame. Must be called with
+    model.state_lock held; everything else is drawn after the lock is released.
+    """
+    first_step = vs.left_most_step
+    last_step = first_step + layout.num_visible_steps
+    rows = []
+    for original_index in filtered_indices[
+        vs.top_row : vs.top_row + layout.task_list_h
+    ]:
+        task = model.tasks[original_index]
+        rows.append(
+            TaskRowSnapshot(
+                task,
+                [
+                    (step.status, step.start_time) if step else None
+                    for step in task.steps[first_step:last_step]
+                ],
+            )
+        )
+    task, step, debug_records = None, None, []
+    if filtered_indices:
+        task = model.tasks[filtered_indices[vs.selected_row]]
+        if 0 <= vs.selected_col < len(task.steps):
+            step = task.steps[vs.selected_col]
+        if step and vs.debug_panel_visible:
+            debug_records = list(step.log_handler.buffer)
+    return FrameSnapshot(model.dynamic_header, rows, task, step, debug_records)
+
+
+def _file_stat(path: str) -> Tuple[Optional[float], Optional[int]]:
+    """(mtime, size) of `path` from a single stat(), or (None, None)."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None, None
+    return st.st_mtime, st.st_size
 
 
 def _get_log_file_stats(
@@ -379,66 +689,68 @@ def _get_log_file_stats(
 ) -> Tuple[Optional[float], Optional[int], Optional[float], Optional[int]]:
     if not step:
         return None, None, None, None
-    mtime1, size1, mtime2, size2 = None, None, None, None
-    try:
-        if os.path.exists(step.log_path_stdout):
-            stat = os.stat(step.log_path_stdout)
-            mtime1, size1 = stat.st_mtime, stat.st_size
-        if os.path.exists(step.log_path_stderr):
-            stat = os.stat(step.log_path_stderr)
-            mtime2, size2 = stat.st_mtime, stat.st_size
-    except OSError:
-        pass
-    return mtime1, size1, mtime2, size2
+    return _file_stat(step.log_path_stdout) + _file_stat(step.log_path_stderr)
+
+
+def _wrap_line(line: str, width: int) -> List[str]:
+    """
+    textwrap.wrap() for a single line, skipping the regex tokenizer when the
+    line already fits (the common case for task info and log output).
+    """
+    # isprintable() rules out tabs and non-ASCII spaces, which textwrap treats
+    # specially.
+    if len(line) <= width and line.isprintable():
+        return [line.rstrip(" ")] if line.strip(" ") else []
+    return wrap(line, width)
+
+
+def _wrap_info_cached(
+    vs: ViewState, task: Task, width: int, max_lines: int
+) -> List[str]:
+    cache = vs.info_cache
+    key = (task.uid, width, max_lines)
+    if cache.get("key") == key and cache.get("info") == task.info:
+        return cache["lines"]
+    # Wrap lazily so only the lines that fit in the pane are ever produced.
+    wrapped = (
+        l for line in task.info.splitlines() for l in _wrap_line(line, width) or [""]
+    )
+    lines = list(islice(wrapped, max_lines))
+    vs.info_cache = {"key": key, "info": task.info, "lines": lines}
+    return lines
 
 
 def _draw_bottom_pane(
     stdscr,
     y_start: int,
-    model: TaskModel,
+    snapshot: FrameSnapshot,
     vs: ViewState,
-    filtered_indices: List[int],
     layout: LayoutDimensions,
     main_h: int,
 ):
+    """
+    Draw the info/log pane into its own persistent window and return it, or
+    None when there is no room for it. Like the debug pane, the window is only
+    rewritten when what it shows has changed.
+    """
     if layout.bottom_pane_h <= 1:
-        return
-    stdscr.hline(y_start - 1, 0, curses.ACS_HLINE, stdscr.getmaxyx()[1])
-    if not filtered_indices:
-        _safe_addstr(stdscr, y_start, 1, "No tasks match your search.", curses.A_BOLD)
-        return
-    task = model.tasks[filtered_indices[vs.selected_row]]
-    step = (
-        task.steps[vs.selected_col] if 0 <= vs.selected_col < len(task.steps) else None
-    )
-    if vs.selected_col == -1:
-        _safe_addstr(
-            stdscr,
-            y_start,
-            1,
-            f"Full Info for: {task.name}"[: layout.log_panel_w - 2],
-            curses.A_BOLD,
+        vs.log_pane.close()
+        return None
+    w = stdscr.getmaxyx()[1]
+    stdscr.hline(y_start - 1, 0, curses.ACS_HLINE, w)
+    win = vs.log_pane.get(main_h - y_start, min(w, layout.log_panel_w + 1), y_start, 0)
+    task, step = snapshot.selected_task, snapshot.selected_step
+    # Render keys hold the shown objects themselves rather than their id()s,
+    # so a recycled id can never make stale content look current.
+    pane_key = (layout.log_panel_w, layout.bottom_pane_h)
+    if task is None:
+        render_key = pane_key
+    elif vs.selected_col == -1:
+        info_lines = _wrap_info_cached(
+            vs, task, layout.log_panel_w - 4, layout.bottom_pane_h - 1
         )
-        info_lines = [
-            l
-            for line in task.info.splitlines()
-            for l in wrap(line, layout.log_panel_w - 4) or [""]
-        ]
-        for i, line in enumerate(info_lines[: layout.bottom_pane_h - 1]):
-            _safe_addstr(stdscr, y_start + 1 + i, 2, line)
+        render_key = pane_key + (task, info_lines)
     elif step:
-        header_text = (
-            model.dynamic_header[vs.selected_col + 2]
-            if vs.selected_col + 2 < len(model.dynamic_header)
-            else ""
-        )
-        _safe_addstr(
-            stdscr,
-            y_start,
-            1,
-            f"Details for: {task.name} -> {header_text}"[: layout.log_panel_w - 2],
-            curses.A_BOLD,
-        )
         cache = vs.log_cache
         cache_key = (task.uid, vs.selected_col)
         mtime_out, size_out, mtime_err, size_err = _get_log_file_stats(step)
@@ -452,7 +764,7 @@ def _draw_bottom_pane(
             output_lines = cache["content"]
         else:
             output_lines = read_log_files(step)
-            vs.log_cache = {
+            cache = vs.log_cache = {
                 "key": cache_key,
                 "content": output_lines,
                 "mtime_out": mtime_out,
@@ -461,128 +773,216 @@ def _draw_bottom_pane(
                 "size_err": size_err,
             }
 
+        # Re-wrap only when the log content or the panel width changed.
         log_content_width = max(1, layout.log_panel_w - 4)
-        wrapped_log_lines = [
-            (p, color)
-            for line_text, color in output_lines
-            for p in (
-                wrap(
-                    line_text.replace("\0", "?").expandtabs().rstrip("\n"),
-                    log_content_width,
+        if cache.get("wrap_width") == log_content_width:
+            wrapped_log_lines = cache["wrapped"]
+        else:
+            # Store each display line with its final attribute: bold is
+            # decided per wrapped piece here, once, not on every draw.
+            bold = curses.A_BOLD
+            wrapped_log_lines = [
+                (p, PAIR_ATTRS[color] | (bold if p.startswith("[") else 0))
+                for line_text, color in output_lines
+                for p in (
+                    _wrap_line(
+                        line_text.replace("\0", "?").expandtabs().rstrip("\n"),
+                        log_content_width,
+                    )
+                    or [""]
                 )
-                or [""]
-            )
-        ]
+            ]
+            cache["wrapped"] = wrapped_log_lines
+            cache["wrap_width"] = log_content_width
 
         max_scroll = max(0, len(wrapped_log_lines) - (layout.bottom_pane_h - 1))
         vs.log_scroll_offset = min(vs.log_scroll_offset, max_scroll)
-        visible_lines = wrapped_log_lines[
-            vs.log_scroll_offset : vs.log_scroll_offset + layout.bottom_pane_h - 1
-        ]
+        render_key = pane_key + (
+            task,
+            vs.selected_col,
+            wrapped_log_lines,
+            vs.log_scroll_offset,
+        )
+    else:
+        render_key = pane_key + (task, vs.selected_col)
+    if render_key == vs.log_pane.render_key:
+        return win
+    vs.log_pane.render_key = render_key
+    win.erase()
 
-        for idx, (line, color) in enumerate(visible_lines):
-            attr = curses.color_pair(color.value) | (
-                curses.A_BOLD if line.startswith("[") else 0
-            )
-            _safe_addstr(stdscr, y_start + 1 + idx, 2, line.replace("\0", "?"), attr)
+    if task is None:
+        _safe_addstr(win, 0, 1, "No tasks match your search.", curses.A_BOLD)
+    elif vs.selected_col == -1:
+        _safe_addstr(
+            win,
+            0,
+            1,
+            f"Full Info for: {task.name}"[: layout.log_panel_w - 2],
+            curses.A_BOLD,
+        )
+        for i, line in enumerate(info_lines):
+            _safe_addstr(win, 1 + i, 2, line)
+    elif step:
+        header_text = _step_header(snapshot.dynamic_header, vs.selected_col)
+        _safe_addstr(
+            win,
+            0,
+            1,
+            f"Details for: {task.name} -> {header_text}"[: layout.log_panel_w - 2],
+            curses.A_BOLD,
+        )
+        visible_lines = islice(
+            wrapped_log_lines,
+            vs.log_scroll_offset,
+            vs.log_scroll_offset + layout.bottom_pane_h - 1,
+        )
+        for idx, (line, attr) in enumerate(visible_lines):
+            _safe_addstr(win, 1 + idx, 2, line, attr)
 
         if vs.log_scroll_offset > 0:
             _safe_addstr(
-                stdscr,
-                y_start,
+                win,
+                0,
                 max(2, layout.log_panel_w - SCROLL_INDICATOR_PADDING),
                 SCROLL_UP_INDICATOR,
-                curses.color_pair(ColorPair.PENDING.value),
+                PAIR_ATTRS[ColorPair.PENDING],
             )
         if vs.log_scroll_offset < max_scroll:
             _safe_addstr(
-                stdscr,
-                main_h - 1,
+                win,
+                main_h - 1 - y_start,
                 max(2, layout.log_panel_w - SCROLL_INDICATOR_PADDING),
                 SCROLL_DOWN_INDICATOR,
-                curses.color_pair(ColorPair.PENDING.value),
+                PAIR_ATTRS[ColorPair.PENDING],
             )
     else:
-        _safe_addstr(stdscr, y_start, 1, f"Details for: {task.name}", curses.A_BOLD)
-        _safe_addstr(stdscr, y_start + 2, 2, "[No step defined for this column]")
+        _safe_addstr(win, 0, 1, f"Details for: {task.name}", curses.A_BOLD)
+        _safe_addstr(win, 2, 2, "[No step defined for this column]")
+    return win
+
+
+def _wrap_debug_records(
+    vs: ViewState, step: Step, records: List[logging.LogRecord], width: int
+) -> List[str]:
+    """
+    Formatted and wrapped debug lines for `records`. Until the bounded debug
+    buffer fills up it only grows, so while the step and width are unchanged
+    just the records appended since the last call are formatted and wrapped.
+    """
+    cache = vs.debug_wrap_cache
+    done = cache.get("count", 0)
+    if (
+        cache.get("step") is not step
+        or cache.get("width") != width
+        or done > len(records)
+        or (done and records[done - 1] is not cache["last"])
+    ):
+        cache = vs.debug_wrap_cache = {"step": step, "width": width, "lines": []}
+        done = 0
+    formatter = step.log_handler.formatter
+    cache["lines"].extend(
+        p
+        for record in islice(records, done, None)
+        for p in _wrap_line(formatter.format(record).replace("\0", "?"), width) or [""]
+    )
+    cache["count"] = len(records)
+    cache["last"] = records[-1] if records else None
+    return cache["lines"]
 
 
 def _draw_debug_pane(
     stdscr,
     y_start: int,
-    model: TaskModel,
+    snapshot: FrameSnapshot,
     vs: ViewState,
-    filtered_indices: List[int],
     layout: LayoutDimensions,
     main_h: int,
 ):
+    """
+    Draw the debug log into its own persistent window and return it, or None
+    when the panel is hidden. The window is only rewritten when what it shows
+    has changed; the caller flushes it with noutrefresh()/doupdate().
+    """
     if not vs.debug_panel_visible or layout.debug_panel_w <= 1:
-        return
+        vs.debug_pane.close()
+        return None
     debug_x = layout.log_panel_w + 1 + INTER_COL_SEPARATOR_WIDTH
     stdscr.vline(
         y_start - 1, layout.log_panel_w + 1, curses.ACS_VLINE, layout.bottom_pane_h + 1
     )
-    if not filtered_indices:
-        _safe_addstr(stdscr, y_start, debug_x, "Debug Log", curses.A_BOLD)
-        return
-    task = model.tasks[filtered_indices[vs.selected_row]]
-    step = (
-        task.steps[vs.selected_col] if 0 <= vs.selected_col < len(task.steps) else None
+    win_w = stdscr.getmaxyx()[1] - debug_x
+    win = vs.debug_pane.get(main_h - y_start, win_w, y_start, debug_x)
+    task, step = snapshot.selected_task, snapshot.selected_step
+    records = snapshot.debug_records
+    render_key = (
+        task,
+        step,
+        vs.selected_col,
+        len(records),
+        records[-1] if records else None,
+        vs.debug_scroll_offset,
+        layout.debug_panel_w,
+        layout.bottom_pane_h,
     )
-    panel_title, log_snapshot = "Debug Log", ["No task selected."]
+    if render_key == vs.debug_pane.render_key:
+        return win
+    win.erase()
+    if task is None:
+        _safe_addstr(win, 0, 0, "Debug Log", curses.A_BOLD)
+        vs.debug_pane.render_key = render_key
+        return win
+    debug_content_width = max(1, layout.debug_panel_w - 2)
     if step:
-        header = (
-            model.dynamic_header[vs.selected_col + 2]
-            if vs.selected_col + 2 < len(model.dynamic_header)
-            else ""
-        )
+        header = _step_header(snapshot.dynamic_header, vs.selected_col)
         panel_title = f"Debug: {task.name} -> {header}"
-        formatter = step.log_handler.formatter
-        log_snapshot = [formatter.format(record) for record in step.log_handler.buffer]
-    elif vs.selected_col == -1:
-        panel_title, log_snapshot = f"Debug: {task.name}", [
-            "Info column has no debug log."
-        ]
+        wrapped_lines = _wrap_debug_records(vs, step, records, debug_content_width)
     else:
-        panel_title, log_snapshot = f"Debug: {task.name}", ["No step defined here."]
-    _safe_addstr(
-        stdscr, y_start, debug_x, panel_title[: layout.debug_panel_w - 1], curses.A_BOLD
-    )
-    wrapped_lines = [
-        p
-        for entry in log_snapshot
-        for p in wrap(entry, max(1, layout.debug_panel_w - 2)) or [""]
-    ]
+        panel_title = f"Debug: {task.name}"
+        message = (
+            "Info column has no debug log."
+            if vs.selected_col == -1
+            else "No step defined here."
+        )
+        wrapped_lines = wrap(message, debug_content_width)
+    _safe_addstr(win, 0, 0, panel_title[: layout.debug_panel_w - 1], curses.A_BOLD)
     max_scroll = max(0, len(wrapped_lines) - (layout.bottom_pane_h - 1))
     vs.debug_scroll_offset = min(vs.debug_scroll_offset, max_scroll)
-    visible_lines = wrapped_lines[
-        vs.debug_scroll_offset : vs.debug_scroll_offset + layout.bottom_pane_h - 1
-    ]
+    visible_lines = islice(
+        wrapped_lines,
+        vs.debug_scroll_offset,
+        vs.debug_scroll_offset + layout.bottom_pane_h - 1,
+    )
     for i, line in enumerate(visible_lines):
-        _safe_addstr(stdscr, y_start + 1 + i, debug_x, line.replace("\0", "?"))
+        _safe_addstr(win, 1 + i, 0, line)
+    indicator_x = max(0, win_w - SCROLL_INDICATOR_PADDING)
     if vs.debug_scroll_offset > 0:
         _safe_addstr(
-            stdscr,
-            y_start,
-            max(debug_x, stdscr.getmaxyx()[1] - SCROLL_INDICATOR_PADDING),
+            win,
+            0,
+            indicator_x,
             SCROLL_UP_INDICATOR,
-            curses.color_pair(ColorPair.PENDING.value),
+            PAIR_ATTRS[ColorPair.PENDING],
         )
     if vs.debug_scroll_offset < max_scroll:
         _safe_addstr(
-            stdscr,
-            main_h - 1,
-            max(debug_x, stdscr.getmaxyx()[1] - SCROLL_INDICATOR_PADDING),
+            win,
+            main_h - 1 - y_start,
+            indicator_x,
             SCROLL_DOWN_INDICATOR,
-            curses.color_pair(ColorPair.PENDING.value),
+            PAIR_ATTRS[ColorPair.PENDING],
         )
+    # Key on the clamped offset so a clamp does not force another redraw.
+    vs.debug_pane.render_key = (
+        render_key[:5] + (vs.debug_scroll_offset,) + render_key[6:]
+    )
+    return win
 
 
 def draw_search_bar(stdscr, w: int, h: int, query: str):
     search_prompt = "Search: "
     bar_y = h - 1
     full_text = search_prompt + query
-    header_attr = curses.color_pair(ColorPair.HEADER.value)
+    header_attr = PAIR_ATTRS[ColorPair.HEADER]
     stdscr.move(bar_y, 0)
     stdscr.clrtoeol()
     _safe_addstr(stdscr, bar_y, 0, full_text, header_attr)
@@ -598,29 +998,66 @@ def draw_ui(
     search_query: str,
     title: str,
 ):
-    stdscr.erase()
     h, w = stdscr.getmaxyx()
     main_h = h - 1 if is_search_mode else h
     if main_h < MIN_APP_HEIGHT:
+        stdscr.erase()
+        vs.screen_key = None
         _safe_addstr(stdscr, 0, 0, "Terminal too small.")
         stdscr.refresh()
         return
-    if vs.layout_dirty:
+    # Recompute only when an input of the layout changed; layout_dirty lets
+    # the controller force it (resize, debug toggle).
+    layout_key = (
+        w,
+        main_h,
+        vs.debug_panel_visible,
+        len(model.tasks),
+        model.max_name_len,
+        model.max_step_header_len,
+    )
+    if vs.layout_dirty or vs.layout_key != layout_key:
         vs.cached_layout = calculate_layout_dimensions(
             w, model, main_h, vs.debug_panel_visible
         )
+        vs.layout_key = layout_key
         vs.layout_dirty = False
     layout = vs.cached_layout
+    # Everything else drawn on stdscr overwrites itself in place (full-width
+    # header lines, separators), so only a change of geometry or horizontal
+    # scroll needs a blank slate.
+    screen_key = (h, w, is_search_mode, layout, vs.left_most_step)
+    if screen_key != vs.screen_key:
+        stdscr.erase()
+        vs.screen_key = screen_key
+        vs.row_keys = {}
+    # Hold the lock only while copying state so workers are never blocked
+    # behind curses output or log file reads.
     with model.state_lock:
-        y_bottom_pane_start = HEADER_ROWS + layout.task_list_h + SEPARATOR_ROWS
-        _draw_header(stdscr, w, title, is_search_mode)
-        _draw_task_table(stdscr, model, vs, filtered_indices, layout)
-        _draw_bottom_pane(
-            stdscr, y_bottom_pane_start, model, vs, filtered_indices, layout, main_h
-        )
-        _draw_debug_pane(
-            stdscr, y_bottom_pane_start, model, vs, filtered_indices, layout, main_h
+        snapshot = _snapshot_frame(model, vs, filtered_indices, layout)
+    y_bottom_pane_start = HEADER_ROWS + layout.task_list_h + SEPARATOR_ROWS
+    _draw_header(stdscr, w, title, is_search_mode)
+    _draw_task_table(stdscr, snapshot, vs, layout)
+    pane_wins = [
+        win
+        for win in (
+            _draw_bottom_pane(
+                stdscr, y_bottom_pane_start, snapshot, vs, layout, main_h
+            ),
+            _draw_debug_pane(stdscr, y_bottom_pane_start, snapshot, vs, layout, main_h),
         )
+        if win is not None
+    ]
     if is_search_mode:
         draw_search_bar(stdscr, w, h, search_query)
-    stdscr.refresh()
+    if not pane_wins:
+        stdscr.refresh()
+        return
+    # After an erase stdscr blanks the area under the pane windows, so they
+    # are always copied again; doupdate() then emits only real diffs in a
+    # single burst.
+    stdscr.noutrefresh()
+    for win in pane_wins:
+        win.touchwin()
+        win.noutrefresh()
+    curses.doupdate()
@@ -181,6 +181,20 @@ class TestModel(unittest.TestCase):
         self.assertIsNone(step.start_time)
         self.assertIsNotNone(step.logger)
 
+    def test_step_debug_log_is_bounded(self):
+        """Only the newest DEBUG_LOG_MAX_LINES debug records are kept."""
+        from taskpanel.model import Step
+
+        step = Step("echo test", "/tmp/out.log", "/tmp/err.log", "boundlog", 0)
+        for i in range(model.DEBUG_LOG_MAX_LINES + 10):
+            step.logger.debug(f"entry {i}")
+        buffer = step.log_handler.buffer
+        self.assertEqual(len(buffer), model.DEBUG_LOG_MAX_LINES)
+        self.assertEqual(
+            buffer[-1].getMessage(), f"entry {model.DEBUG_LOG_MAX_LINES + 9}"
+        )
+        self.assertEqual(buffer[0].getMessage(), "entry 10")
+
     def test_task_creation(self):
         """Test Task class creation and attributes."""
         from taskpanel.model import Task, Step
@@ -225,6 +239,21 @@ class TestModel(unittest.TestCase):
 
         self.assertEqual(len(task_model.tasks), 2)
 
+    def test_column_widths_tracked_on_load(self):
+        """Test that name/step-header widths are maintained while loading."""
+        csv_content = (
+            "TaskName,Info,Build,A Much Longer Step\n"
+            "Short,Info,echo 1,echo 2\n"
+            "A Rather Long Task Name,Info,echo 1,\n"
+        )
+        self._create_csv(csv_content)
+
+        task_model = TaskModel(str(self.csv_path))
+        task_model.load_tasks_from_csv()
+
+        self.assertEqual(task_model.max_name_len, len("A Rather Long Task Name"))
+        self.assertEqual(task_model.max_step_header_len, len("A Much Longer Step"))
+
     def test_csv_with_unicode_content(self):
         """Test CSV with Unicode characters."""
         csv_content = (
@@ -745,6 +774,31 @@ class TestModel(unittest.TestCase):
         # Next step becomes SKIPPED
         self.assertEqual(tm.tasks[0].steps[1].status, Status.SKIPPED)
 
+    def test_version_bumped_on_state_changes(self):
+        """Status transitions advance model.version; reads and logging do not."""
+        self._create_csv("TaskName,Info,Cmd1,Cmd2,Cmd3\nT,Info,echo a,false,echo c\n")
+        tm = TaskModel(str(self.csv_path))
+        tm.load_tasks_from_csv()
+        v0 = tm.version
+        tm.run_task_row(0, tm.tasks[0].run_counter, 0)
+        self.assertEqual(tm.tasks[0].steps[2].status, Status.SKIPPED)
+        v1 = tm.version
+        self.assertGreater(v1, v0)
+        tm.persist_state()
+        tm._log_step_debug(0, 0, "just a note")
+        self.assertEqual(tm.version, v1)
+        # Nothing running: kill changes no status
+        tm.kill_task_row(0)
+        self.assertEqual(tm.version, v1)
+
+        steps = tm.tasks[0].steps
+        steps[1].status = Status.RUNNING
+        steps[2].status = Status.PENDING
+        tm.kill_task_row(0)
+        self.assertEqual(steps[1].status, Status.KILLED)
+        self.assertEqual(steps[2].status, Status.SKIPPED)
+        self.assertGreater(tm.version, v1)
+
     # --- New: run_task_row subprocess raises exception ---
     def test_run_task_row_subprocess_error(self):
         """Popen raising FileNotFoundError should mark FAILED."""
@@ -7,6 +7,7 @@ test_runner.py
 Simple tests for TaskPanel runner module - focused on packaging and basic functionality.
 """
 
+import itertools
 import os
 import sys
 import unittest
@@ -934,3 +935,123 @@ class TestRunner(unittest.TestCase):
             c.view_state.cached_layout = MagicMock(task_list_h=3)
             c._handle_nav_page_down()
             self.assertGreaterEqual(c.view_state.top_row, 0)
+
+    def test_drain_input_handles_queued_keys(self):
+        if runner is None:
+            self.skipTest("runner module not available")
+        with patch("curses.curs_set"), patch(
+            "taskpanel.runner.setup_colors"
+        ), patch.object(runner.TaskModel, "load_tasks"):
+            stdscr = MagicMock()
+            stdscr.getch.side_effect = [ord("]"), ord("]"), ord("]"), -1, -1]
+            c = runner.AppController(stdscr, "/tmp/no.csv", 1, "T")
+            self.assertTrue(c.drain_input())
+            self.assertEqual(c.view_state.log_scroll_offset, 3)
+            # Nothing queued: nothing handled.
+            self.assertFalse(c.drain_input())
+
+    def test_run_loop_refreshes_slowly_when_idle(self):
+        if runner is None:
+            self.skipTest("runner module not available")
+        with patch("curses.curs_set"), patch(
+            "taskpanel.runner.setup_colors"
+        ), patch.object(runner.TaskModel, "load_tasks"), patch(
+            "taskpanel.runner.draw_ui"
+        ) as mock_draw_ui, patch(
+            "taskpanel.runner.time"
+        ) as mock_time:
+            mock_time.monotonic.side_effect = itertools.count(0, 0.5)
+            stdscr = MagicMock()
+            stdscr.getch.side_effect = [-1] * 20 + [ord("q")]
+            c = runner.AppController(stdscr, "/tmp/no.csv", 1, "T")
+            c.model.tasks = []
+            with patch.object(c, "start_initial_tasks"), patch.object(
+                c.model, "cleanup"
+            ):
+                c.run_loop()
+            # Nothing is running: still refreshed, but far less than every tick.
+            self.assertGreater(mock_draw_ui.call_count, 1)
+            self.assertLess(mock_draw_ui.call_count, 10)
+
+    def test_run_loop_draws_finished_step_log_growth_without_input(self):
+        if runner is None:
+            self.skipTest("runner module not available")
+        from taskpanel.model import Status
+
+        log_path = os.path.join(self.test_dir, "step.out")
+        with open(log_path, "w") as f:
+            f.write("first\n")
+        step = MagicMock()
+        step.status = Status.SUCCESS
+        task = MagicMock()
+        task.steps = [step]
+        drawn = []
+
+        def record_frame(*args):
+            with open(log_path) as f:
+                drawn.append(f.read())
+
+        ticks = itertools.count()
+
+        def getch():
+            tick = next(ticks)
+            if tick == 2:
+                # A background child of the finished step keeps writing.
+                with open(log_path, "a") as f:
+                    f.write("late\n")
+            return ord("q") if tick == 20 else -1
+
+        with patch("curses.curs_set"), patch(
+            "taskpanel.runner.setup_colors"
+        ), patch.object(runner.TaskModel, "load_tasks"), patch(
+            "taskpanel.runner.draw_ui", side_effect=record_frame
+        ), patch(
+            "taskpanel.runner.time"
+        ) as mock_time:
+            mock_time.monotonic.side_effect = itertools.count(0, 0.5)
+            stdscr = MagicMock()
+            stdscr.getch.side_effect = getch
+            c = runner.AppController(stdscr, "/tmp/no.csv", 1, "T")
+            c.model.tasks = [task]
+            with patch.object(c, "start_initial_tasks"), patch.object(
+                c.model, "cleanup"
+            ):
+                c.run_loop()
+        self.assertEqual(drawn[0], "first\n")
+        self.assertEqual(drawn[-1], "first\nlate\n")
+
+    def test_run_loop_coalesces_redraws_within_frame_interval(self):
+        if runner is None:
+            self.skipTest("runner module not available")
+        with patch("curses.curs_set"), patch(
+            "taskpanel.runner.setup_colors"
+        ), patch.object(runner.TaskModel, "load_tasks"), patch(
+            "taskpanel.runner.draw_ui"
+        ) as mock_draw_ui, patch(
+            "taskpanel.runner.time"
+        ) as mock_time:
+            # Time stands still: every key lands inside the first frame.
+            mock_time.monotonic.return_value = 100.0
+            stdscr = MagicMock()
+            stdscr.getch.side_effect = [ord("]"), -1] * 3 + [ord("q")]
+            c = runner.AppController(stdscr, "/tmp/no.csv", 1, "T")
+            c.model.tasks = []
+            with patch.object(c, "start_initial_tasks"), patch.object(
+                c.model, "cleanup"
+            ):
+                c.run_loop()
+            self.assertEqual(mock_draw_ui.call_count, 1)
+            self.assertEqual(c.view_state.log_scroll_offset, 3)
+
+    def test_drain_input_stops_on_quit(self):
+        if runner is None:
+            self.skipTest("runner module not available")
+        with patch("curses.curs_set"), patch(
+            "taskpanel.runner.setup_colors"
+        ), patch.object(runner.TaskModel, "load_tasks"):
+            stdscr = MagicMock()
+            stdscr.getch.return_value = ord("q")
+            c = runner.AppController(stdscr, "/tmp/no.csv", 1, "T")
+            self.assertTrue(c.drain_input())
+            self.assertFalse(c.app_running)
+            self.assertEqual(stdscr.getch.call_count, 1)
@@ -258,6 +258,101 @@ class TestView(unittest.TestCase):
         res = get_status_color(object())  # type: ignore
         self.assertEqual(res, 42)
 
+    @patch("curses.start_color")
+    @patch("curses.use_default_colors")
+    @patch("curses.init_pair")
+    def test_setup_colors_builds_status_tables(self, *_mocks):
+        """setup_colors resolves attributes for each pair and status, plus labels."""
+        with patch("curses.color_pair", side_effect=lambda n: n << 8):
+            setup_colors()
+        for status in Status:
+            self.assertEqual(
+                view.STATUS_ATTRS[status], STATUS_COLOR_MAP[status].value << 8
+            )
+        self.assertIn(None, view.STATUS_ATTRS)
+        for pair in ColorPair:
+            self.assertEqual(view.PAIR_ATTRS[pair], pair.value << 8)
+
+        cells = view._status_cells(12)
+        self.assertEqual(cells[Status.SUCCESS], " SUCCESS ".center(12))
+        self.assertEqual(cells[None], view.EMPTY_STEP_TEXT.center(12))
+        self.assertIs(view._status_cells(12), cells)
+
+    def test_table_header_line_layout(self):
+        """The table header row is assembled once per header/width combination."""
+        if view is None:
+            self.skipTest("view module not available")
+        header = ("Name", "Info", "Build", "Test", "Deploy")
+        line = view._table_header_line(header, 1, 2, 6, 6, 8)
+        self.assertEqual(
+            line,
+            " Name ".ljust(6 + view.COL_PADDING)
+            + " Info ".ljust(6 + view.INTER_COL_SEPARATOR_WIDTH)
+            + "  Test  "
+            + " Deploy ",
+        )
+        self.assertIs(view._table_header_line(header, 1, 2, 6, 6, 8), line)
+
+    def test_task_table_centres_wide_headers_in_their_columns(self):
+        """Non-ASCII step headers are each written at their own column x."""
+        if view is None or ViewState is None:
+            self.skipTest("view module not available")
+        header = ["任务名", "信息描述", "构建步骤", "测试", "Deploy"]
+        layout = view.LayoutDimensions(4, 15, 10, 3, 15, 10, 100, 0)
+        snapshot = view.FrameSnapshot(header, [], None, None, [])
+        stdscr = MagicMock()
+        stdscr.getmaxyx.return_value = (30, 100)
+
+        view._draw_task_table(stdscr, snapshot, ViewState(), layout)
+
+        steps_x = view.TABLE_X_OFFSET + 4 + view.COL_PADDING + 15 + 1
+        writes = [c.args[1:3] for c in stdscr.addnstr.call_args_list]
+        self.assertEqual(
+            writes[2:],
+            [
+                (steps_x, "构建步骤".center(10)),
+                (steps_x + 10, "测试".center(10)),
+                (steps_x + 20, "Deploy".center(10)),
+            ],
+        )
+
+    def test_row_prefix_pads_and_truncates(self):
+        """Name and info columns are padded, clipped and marked when truncated."""
+        if view is None:
+            self.skipTest("view module not available")
+        prefix = view._row_prefix("Build", "first line\nsecond", 8, 12)
+        self.assertEqual(
+            prefix,
+            "Build   " + view.NAME_INFO_GAP + "first lin..." + view.INFO_STEPS_GAP,
+        )
+        self.assertEqual(len(view._row_prefix("x", "", 8, 12)), len(prefix))
+
+    def test_task_row_with_wide_name_writes_columns_at_fixed_x(self):
+        """Non-ASCII rows are written per column so cells stay under their headers."""
+        if view is None or ViewState is None or Task is None:
+            self.skipTest("Required modules not available")
+        task = Task(0, "uid", "测试任务", "信息描述", [None, None], "hash")
+        row = view.TaskRowSnapshot(
+            task, [(Status.SUCCESS, None), (Status.FAILED, None)]
+        )
+        layout = view.LayoutDimensions(4, 15, 17, 2, 15, 10, 100, 0)
+        steps_x = view.TABLE_X_OFFSET + 4 + view.COL_PADDING + 15
+        step_xs = [steps_x + 1, steps_x + 18]
+        stdscr = MagicMock()
+        stdscr.getmaxyx.return_value = (30, 100)
+
+        view._draw_task_row(stdscr, 5, row, False, ViewState(), layout, step_xs)
+
+        writes = [c.args[:3] + c.args[4:] for c in stdscr.addnstr.call_args_list]
+        self.assertEqual(writes[0], (5, view.TABLE_X_OFFSET, "测试任务", 0))
+        self.assertEqual(writes[1][:2], (5, view.TABLE_X_OFFSET + 4 + view.COL_PADDING))
+        success = view.STATUS_ATTRS[Status.SUCCESS]
+        failed = view.STATUS_ATTRS[Status.FAILED]
+        self.assertEqual(writes[2], (5, step_xs[0], " SUCCESS ".center(17), success))
+        self.assertEqual(writes[3], (5, step_xs[1], " FAILED ".center(17), failed))
+        self.assertEqual(len(writes), 4)
+        stdscr.chgat.assert_not_called()
+
     def test_tail_file_nonexistent(self):
         """Test _tail_file with non-existent file."""
         if _tail_file is None:
@@ -300,6 +395,74 @@ class TestView(unittest.TestCase):
         finally:
             os.unlink(temp_path)
 
+    def test_tail_file_cached_rereads_only_on_change(self):
+        """Cached tails are reused until the file's size or mtime changes."""
+        if view is None:
+            self.skipTest("view module not available")
+
+        with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
+            temp_path = f.name
+            f.write("Line 1\n")
+
+        try:
+            first = view._tail_file_cached(temp_path, 10)
+            with patch("taskpanel.view._tail_file") as mock_tail:
+                self.assertIs(view._tail_file_cached(temp_path, 10), first)
+                mock_tail.assert_not_called()
+            with open(temp_path, "a") as f:
+                f.write("Line 2\n")
+            self.assertEqual(
+                view._tail_file_cached(temp_path, 10), ["Line 1\n", "Line 2\n"]
+            )
+        finally:
+            os.unlink(temp_path)
+
+    def test_tail_file_cached_reads_appended_bytes_only(self):
+        """A grown log is extended from the cached offset, partial lines included."""
+        if view is None:
+            self.skipTest("view module not available")
+
+        with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
+            temp_path = f.name
+            f.write("Line 1\nLine 2\npart")
+
+        try:
+            self.assertEqual(
+                view._tail_file_cached(temp_path, 2), ["Line 2\n", "part\n"]
+            )
+            with open(temp_path, "a") as f:
+                f.write("ial\nLine 4\n")
+            with patch("taskpanel.view._read_tail") as mock_read_tail:
+                result = view._tail_file_cached(temp_path, 2)
+                mock_read_tail.assert_not_called()
+            self.assertEqual(result, ["partial\n", "Line 4\n"])
+            self.assertEqual(result, _tail_file(temp_path, 2))
+        finally:
+            os.unlink(temp_path)
+
+    def test_tail_file_cached_rereads_log_rewritten_in_place(self):
+        """A log truncated and rewritten past its old size is not spliced."""
+        if view is None:
+            self.skipTest("view module not available")
+
+        with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
+            temp_path = f.name
+            f.write("old line one\nold line two\n")
+
+        try:
+            view._tail_file_cached(temp_path, 3)
+            # What a rerun does: reopen with "wb" and write more than before.
+            with open(temp_path, "wb") as f:
+                f.write(b"new output A\nnew output B\nnew output C\n")
+            st = os.stat(temp_path)
+            os.utime(temp_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1))
+            self.assertEqual(
+                view._tail_file_cached(temp_path, 3),
+                ["new output A\n", "new output B\n", "new output C\n"],
+            )
+        finally:
+            os.unlink(temp_path)
+
     def test_read_log_files_no_step(self):
         """Test read_log_files with None step."""
         if read_log_files is None:
@@ -341,6 +504,26 @@ class TestView(unittest.TestCase):
         self.assertIn("stdout line 1", result_text)
         self.assertIn("stderr line 1", result_text)
 
+    @patch("taskpanel.view._tail_file_cached")
+    def test_read_log_files_keeps_newest_lines(self, mock_tail):
+        """Combined output is capped at LOG_BUFFER_LINES, dropping oldest stdout."""
+        if read_log_files is None or Step is None:
+            self.skipTest("Required classes not available")
+        mock_step = MagicMock(spec=Step)
+        mock_step.log_path_stdout = "/path/to/stdout.log"
+        mock_step.log_path_stderr = "/path/to/stderr.log"
+        stdout = [f"out {i}\n" for i in range(LOG_BUFFER_LINES)]
+        stderr = ["err 0\n", "err 1\n"]
+        mock_tail.side_effect = lambda path, n: stdout if "stdout" in path else stderr
+
+        result = read_log_files(mock_step)
+
+        self.assertEqual(len(result), LOG_BUFFER_LINES)
+        self.assertEqual(
+            [line for line, _ in result[-3:]], ["\n[STDERR]\n", "err 0\n", "err 1\n"]
+        )
+        self.assertEqual(result[0][0], stdout[3])
+
     def test_calculate_layout_dimensions_empty_model(self):
         """Test calculate_layout_dimensions with empty model."""
         if calculate_layout_dimensions is None or TaskModel is None:
@@ -372,6 +555,8 @@ class TestView(unittest.TestCase):
         mock_model = MagicMock(spec=TaskModel)
         mock_model.tasks = [mock_task1, mock_task2]
         mock_model.dynamic_header = ["Task Name", "Info", "Step1", "Step2"]
+        mock_model.max_name_len = len("Very Long Task Name")
+        mock_model.max_step_header_len = len("Step1")
 
         layout = calculate_layout_dimensions(100, mock_model, 30, False)
 
@@ -545,6 +730,27 @@ class TestView(unittest.TestCase):
             os.unlink(stdout_path)
             os.unlink(stderr_path)
 
+    def test_get_log_file_stats_missing_stderr(self):
+        """A missing log yields (None, None) without affecting the other one."""
+        if view is None or Step is None:
+            self.skipTest("Required modules not available")
+
+        with tempfile.NamedTemporaryFile(delete=False) as stdout_file:
+            stdout_path = stdout_file.name
+            stdout_file.write(b"stdout content")
+
+        try:
+            mock_step = MagicMock(spec=Step)
+            mock_step.log_path_stdout = stdout_path
+            mock_step.log_path_stderr = stdout_path + ".missing"
+            with patch("os.path.exists") as mock_exists:
+                result = view._get_log_file_stats(mock_step)
+                mock_exists.assert_not_called()
+            self.assertEqual(result[1], len(b"stdout content"))
+            self.assertEqual(result[2:], (None, None))
+        finally:
+            os.unlink(stdout_path)
+
     @patch("curses.start_color")
     @patch("curses.has_colors")
     @patch("curses.color_pair")
@@ -876,3 +1082,239 @@ class TestView(unittest.TestCase):
         except Exception as e:
             self.fail(f"draw_ui raised unexpectedly: {e}")
         self.assertTrue(stdscr.refresh.called)
+
+    def test_draw_ui_relayouts_when_search_bar_toggles(self):
+        """The cached layout follows the usable height without a dirty flag."""
+        if view is None or ViewState is None or TaskModel is None:
+            self.skipTest("view not available")
+        stdscr = MagicMock()
+        stdscr.getmaxyx.return_value = (30, 80)
+        model = TaskModel("/tmp/unused.csv")
+        model.dynamic_header = ["Task", "Info"]
+        vs = ViewState()
+        with patch("curses.newwin") as mock_newwin, patch("curses.doupdate"), patch(
+            "curses.ACS_HLINE", 0, create=True
+        ):
+            mock_newwin.return_value.getmaxyx.return_value = (10, 80)
+            view.draw_ui(stdscr, model, vs, [], False, "", "T")
+            full = vs.cached_layout
+            view.draw_ui(stdscr, model, vs, [], True, "", "T")
+            searching = vs.cached_layout
+            self.assertEqual(searching.task_list_h, full.task_list_h - 1)
+            view.draw_ui(stdscr, model, vs, [], True, "", "T")
+            self.assertIs(vs.cached_layout, searching)
+
+    def test_wrap_info_cached_reuses_lines(self):
+        """Wrapped info lines are reused until the info text or width changes."""
+        if view is None or ViewState is None or Task is None:
+            self.skipTest("Required modules not available")
+        vs = ViewState()
+        task = Task(1, "uid", "T", "first line\nsecond line", [], "hash")
+        lines = view._wrap_info_cached(vs, task, 40, 10)
+        self.assertEqual(lines, ["first line", "second line"])
+        self.assertIs(view._wrap_info_cached(vs, task, 40, 10), lines)
+        self.assertIsNot(view._wrap_info_cached(vs, task, 5, 10), lines)
+        task.info = "changed"
+        self.assertEqual(view._wrap_info_cached(vs, task, 5, 10), ["chang", "ed"])
+
+    def test_wrap_info_cached_stops_at_visible_lines(self):
+        """Only the lines that fit in the pane are wrapped."""
+        if view is None or ViewState is None or Task is None:
+            self.skipTest("Required modules not available")
+        vs = ViewState()
+        info = "\n".join(f"line {i}" for i in range(1000))
+        task = Task(1, "uid", "T", info, [], "hash")
+        self.assertEqual(
+            view._wrap_info_cached(vs, task, 40, 3), ["line 0", "line 1", "line 2"]
+        )
+
+    def test_wrap_line_matches_textwrap(self):
+        """The short-line fast path agrees with textwrap.wrap()."""
+        if view is None:
+            self.skipTest("view module not available")
+        from textwrap import wrap
+
+        for line in ["", "   ", "  abc  ", "a\tb", "fits", "x\xa0", "too long here"]:
+            self.assertEqual(view._wrap_line(line, 8), wrap(line, 8), repr(line))
+
+    def test_snapshot_frame_copies_visible_state(self):
+        """_snapshot_frame captures only the visible rows and step columns."""
+        if view is None or ViewState is None or Task is None:
+            self.skipTest("Required modules not available")
+        steps = [Step(f"echo {i}", "/tmp/o", "/tmp/e", "uid", i) for i in range(3)]
+        steps[1].status = Status.RUNNING
+        task = Task(1, "uid", "T", "info", steps, "hash")
+        model = MagicMock()
+        model.tasks = [task, task, task]
+        model.dynamic_header = ["TaskName", "Info", "A", "B", "C"]
+        vs = ViewState()
+        vs.left_most_step = 1
+        layout = view.LayoutDimensions(10, 15, 17, 1, 2, 10, 80, 0)
+
+        snapshot = view._snapshot_frame(model, vs, [0, 1, 2], layout)
+
+        self.assertEqual(len(snapshot.rows), 2)
+        self.assertEqual(snapshot.rows[0].step_states, [(Status.RUNNING, None)])
+        self.assertIs(snapshot.selected_task, task)
+        self.assertIs(snapshot.selected_step, steps[0])
+        self.assertEqual(snapshot.debug_records, [])
+        # Later model changes do not leak into an already taken snapshot.
+        steps[1].status = Status.SUCCESS
+        self.assertEqual(snapshot.rows[0].step_states[0][0], Status.RUNNING)
+
+    @patch("curses.ACS_VLINE", 0, create=True)
+    @patch("curses.newwin")
+    def test_debug_pane_redraws_only_on_change(self, mock_newwin):
+        """The debug window is reused and only rewritten when its content changes."""
+        if view is None or ViewState is None or Task is None:
+            self.skipTest("Required modules not available")
+        step = Step("echo", "/tmp/o", "/tmp/e", "uid-debug-pane", 0)
+        task = Task(1, "uid", "T", "info", [step], "hash")
+        stdscr = MagicMock()
+        stdscr.getmaxyx.return_value = (30, 100)
+        win = mock_newwin.return_value
+        win.getmaxyx.return_value = (10, 48)
+        vs = ViewState()
+        vs.debug_panel_visible = True
+        layout = view.LayoutDimensions(10, 15, 17, 1, 15, 10, 50, 49)
+        snapshot = view.FrameSnapshot(["T", "I", "A"], [], task, step, [])
+
+        view._draw_debug_pane(stdscr, 20, snapshot, vs, layout, 30)
+        view._draw_debug_pane(stdscr, 20, snapshot, vs, layout, 30)
+        self.assertEqual(mock_newwin.call_count, 1)
+        self.assertEqual(win.erase.call_count, 1)
+
+        step.logger.debug("new entry")
+        snapshot = snapshot._replace(debug_records=list(step.log_handler.buffer))
+        view._draw_debug_pane(stdscr, 20, snapshot, vs, layout, 30)
+        self.assertEqual(win.erase.call_count, 2)
+
+    @patch("curses.newwin")
+    def test_log_pane_redraws_only_on_change(self, mock_newwin):
+        """The log pane window is reused and only rewritten when its content changes."""
+        if view is None or ViewState is None or Task is None:
+            self.skipTest("Required modules not available")
+        task = Task(1, "uid", "T", "info", [None], "hash")
+        stdscr = MagicMock()
+        stdscr.getmaxyx.return_value = (30, 100)
+        win = mock_newwin.return_value
+        win.getmaxyx.return_value = (10, 100)
+        vs = ViewState()
+        vs.selected_col = -1
+        layout = view.LayoutDimensions(10, 15, 17, 1, 15, 10, 100, 0)
+        snapshot = view.FrameSnapshot(["T", "I", "A"], [], task, None, [])
+
+        with patch("curses.ACS_HLINE", 0, create=True):
+            view._draw_bottom_pane(stdscr, 20, snapshot, vs, layout, 30)
+            view._draw_bottom_pane(stdscr, 20, snapshot, vs, layout, 30)
+            self.assertEqual(mock_newwin.call_count, 1)
+            self.assertEqual(win.erase.call_count, 1)
+
+            task.info = "changed"
+            view._draw_bottom_pane(stdscr, 20, snapshot, vs, layout, 30)
+            self.assertEqual(win.erase.call_count, 2)
+
+    def test_task_table_rewrites_only_changed_rows(self):
+        """Unchanged task rows are skipped; rows no longer listed are cleared."""
+        if view is None or ViewState is None or Task is None:
+            self.skipTest("Required modules not available")
+        tasks = [Task(i, f"uid{i}", f"T{i}", "info", [None], "hash") for i in range(2)]
+        rows = [view.TaskRowSnapshot(t, [(Status.SUCCESS, None)]) for t in tasks]
+        stdscr = MagicMock()
+        stdscr.getmaxyx.return_value = (30, 100)
+        vs = ViewState()
+        layout = view.LayoutDimensions(10, 15, 17, 1, 15, 10, 100, 0)
+        snapshot = view.FrameSnapshot(["T", "I", "A"], rows, None, None, [])
+
+        view._draw_task_table(stdscr, snapshot, vs, layout)
+        self.assertEqual(stdscr.addnstr.call_count, 3)  # header and both rows
+
+        stdscr.reset_mock()
+        rows[1] = rows[1]._replace(step_states=[(Status.FAILED, None)])
+        view._draw_task_table(stdscr, snapshot, vs, layout)
+        self.assertEqual(stdscr.addnstr.call_count, 2)  # header and changed row
+
+        stdscr.reset_mock()
+        view._draw_task_table(stdscr, snapshot._replace(rows=rows[:1]), vs, layout)
+        self.assertEqual(stdscr.addnstr.call_count, 1)
+        stdscr.move.assert_called_once_with(view.HEADER_ROWS + 1, 0)
+        stdscr.clrtoeol.assert_called_once()
+
+    @patch("curses.newwin")
+    def test_log_pane_bolds_wrapped_pieces_starting_with_bracket(self, mock_newwin):
+        """Bold is decided per wrapped display line, not per log line."""
+        if view is None or ViewState is None or Task is None or Step is None:
+            self.skipTest("Required modules not available")
+        step = MagicMock(spec=Step)
+        step.log_path_stdout = "/nonexistent/stdout.log"
+        step.log_path_stderr = "/nonexistent/stderr.log"
+        task = Task(1, "uid", "T", "info", [step], "hash")
+        stdscr = MagicMock()
+        stdscr.getmaxyx.return_value = (30, 100)
+        mock_newwin.return_value.getmaxyx.return_value = (10, 24)
+        vs = ViewState()
+        layout = view.LayoutDimensions(10, 15, 17, 1, 15, 10, 24, 0)
+        snapshot = view.FrameSnapshot(["T", "I", "A"], [], task, step, [])
+        lines = [
+            ("[info] one two three four\n", ColorPair.DEFAULT),
+            ("aaaaaaaaaaaaaaaa [tag] end\n", ColorPair.DEFAULT),
+        ]
+
+        with patch("taskpanel.view.read_log_files", return_value=lines), patch(
+            "curses.ACS_HLINE", 0, create=True
+        ):
+            view._draw_bottom_pane(stdscr, 20, snapshot, vs, layout, 30)
+
+        bold = [
+            (text, bool(attr & curses.A_BOLD)) for text, attr in vs.log_cache["wrapped"]
+        ]
+        self.assertEqual(
+            bold,
+            [
+                ("[info] one two three", True),
+                ("four", False),
+                ("aaaaaaaaaaaaaaaa", False),
+                ("[tag] end", True),
+            ],
+        )
+
+    def test_wrap_debug_records_formats_new_records_only(self):
+        """Appended debug records are wrapped without re-formatting older ones."""
+        if view is None or ViewState is None or Step is None:
+            self.skipTest("Required modules not available")
+        step = Step("echo", "/tmp/o", "/tmp/e", "wrapdbg1", 0)
+        vs = ViewState()
+        step.logger.debug("first")
+        lines = view._wrap_debug_records(vs, step, list(step.log_handler.buffer), 40)
+        self.assertEqual(len(lines), 1)
+        step.logger.debug("second")
+        records = list(step.log_handler.buffer)
+        with patch.object(
+            step.log_handler.formatter, "format", return_value="second"
+        ) as mock_format:
+            lines = view._wrap_debug_records(vs, step, records, 40)
+        mock_format.assert_called_once_with(records[1])
+        self.assertEqual(len(lines), 2)
+        self.assertTrue(lines[0].endswith("first"))
+        # A different width re-wraps everything.
+        self.assertGreater(len(view._wrap_debug_records(vs, step, records, 5)), 2)
+
+    def test_wrap_debug_records_keyed_on_step_object(self):
+        """A cache built for another step is never reused, even with no records."""
+        if view is None or ViewState is None or Step is None:
+            self.skipTest("Required modules not available")
+        other = Step("echo", "/tmp/o", "/tmp/e", "wrapdbg2", 0)
+        step = Step("echo", "/tmp/o", "/tmp/e", "wrapdbg3", 0)
+        vs = ViewState()
+        vs.debug_wrap_cache = {
+            "step": other,
+            "width": 40,
+            "count": 0,
+            "lines": ["stale"],
+            "last": None,
+        }
+        step.logger.debug("mine")
+        lines = view._wrap_debug_records(vs, step, list(step.log_handler.buffer), 40)
+        self.assertEqual(len(lines), 1)
+        self.assertTrue(lines[0].endswith("mine"))
+        self.assertIs(vs.debug_wrap_cache["step"], step)